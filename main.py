@@ -1,9 +1,55 @@
+import argparse
+import asyncio
+import functools
+import logging
+import queue
+import threading
 import time
+from array import array
 import math
-import board
-import busio
+import struct
 import tkinter as tk
 import tkinter.messagebox as messagebox
+import tkinter.ttk as ttk
+
+log = logging.getLogger(__name__)
+
+# Decoder for the real/imag result: two big-endian int16s, compiled once
+_unpack_sample = struct.Struct('>hh').unpack_from
+
+# Board pins offered for SCL/SDA, keyed by the name shown in the GUI.
+# board probes the platform on import, so it is only loaded on first use.
+_PIN_MAP = None
+
+
+def pin_map():
+    """
+    Return the board pin map, importing board the first time
+    """
+    global _PIN_MAP
+    if _PIN_MAP is None:
+        import board
+        _PIN_MAP = {
+            f"board.{name}": getattr(board, name)
+            for name in dir(board)
+            if name.isupper() and not callable(getattr(board, name))
+        }
+    return _PIN_MAP
+
+
+@functools.lru_cache(maxsize=64)
+def _tick_labels(lo, hi, count, fmt, log_scale=False):
+    """
+    Evenly spaced axis tick values from lo to hi with their formatted labels,
+    cached so unchanged axes do not format the same strings again. With
+    log_scale the values are log10 and the labels show 10**value.
+    """
+    ticks = []
+    for i in range(count + 1):
+        value = lo + i * (hi - lo) / count
+        ticks.append((value, format(10 ** value if log_scale else value, fmt)))
+    return tuple(ticks)
+
 
 class AD5933:
     """
@@ -11,6 +57,12 @@ class AD5933:
     Adapted for CircuitPython I2C communication
     """
     ADDRESS = 0x0D  # I2C address of AD5933
+    I2C_FREQUENCY = 400000  # Fast-mode, the AD5933's rated bus speed
+    CLOCK_FREQ = 4000000    # MCLK / 4, the frequency code reference (Hz)
+    SETTLE_CYCLES = 15      # Output cycles to settle before each conversion
+    ADC_TIME = 1.024e-3     # 1024-sample DFT acquisition (s)
+    TEMP_TIME = 800e-6      # Temperature conversion time (s)
+    MAX_INCREMENTS = 511    # Largest count the 9-bit increments register holds
 
     # Register addresses
     REG_CONTROL         = 0x80
@@ -32,71 +84,241 @@ class AD5933:
     CTRL_POWER_DOWN     = 0xA0
     CTRL_STANDBY        = 0xB0
 
+    # Bus commands, sent in place of a register address
+    CMD_ADDR_POINTER    = 0xB0  # Set the address pointer to the next byte
+    CMD_BLOCK_WRITE     = 0xA0  # Write byte-count registers from the pointer
+    CMD_BLOCK_READ      = 0xA1  # Read the next byte-count registers from the pointer
+
+    # Status Register Bits
+    STATUS_TEMP_VALID   = 0x01
+    STATUS_DATA_VALID   = 0x02
+
     def __init__(self, i2c_bus, debug=False):
         """
         Initialize AD5933 with CircuitPython I2C bus
         
         :param i2c_bus: CircuitPython I2C bus object
-        :param debug: Enable debug printing
+        :param debug: Log every register read and write at DEBUG level
         """
         self.i2c = i2c_bus
         self.debug = debug
 
-    def _write_reg(self, reg, data):
+        # Reusable transmit buffer: block-write command and byte count plus
+        # the 12-byte configuration block, the longest write the driver makes
+        self._tx = bytearray(14)
+        # Range/PGA bits OR-ed into every control command, and the complete
+        # per-point increment-frequency write, rebuilt by configure_sweep
+        self._ctrl_bits = 0
+        self._cmd_incr = bytes((self.REG_CONTROL, self.CTRL_INCR_FREQ))
+        # Receive buffers for the real/imag result, status polls and the
+        # temperature result, reused on every read
+        self._sample = bytearray(4)
+        self._status = bytearray(1)
+        self._temp = bytearray(2)
+
+        # Raw write for prebuilt messages such as the per-point increment
+        self._writeto = i2c_bus.writeto
+
+        # Swap in the logging accessors only when debugging, so the normal
+        # path carries no per-call debug check
+        if debug:
+            self._write_reg = self._write_reg_debug
+            self._block_write = self._block_write_debug
+            self._writeto = self._writeto_debug
+            self._read_fast = self._read_fast_debug
+            self._block_read = self._block_read_debug
+
+    def _write_reg(self, reg, data, settle=0.0):
         """
         Write to a register via I2C
+
+        :param settle: Seconds to wait after the write, for commands that
+                       need time to take effect
         """
         try:
+            message = self._tx
+            message[0] = reg
+            # Single-byte writes (control commands) skip the slice copy
             if isinstance(data, int):
-                data = [data]
-            message = bytearray([reg] + data)
-            self.i2c.writeto(self.ADDRESS, message)
-            if self.debug:
-                print(f"Write to reg {hex(reg)}: {[hex(x) for x in message]}")
-            time.sleep(0.01)
+                message[1] = data
+                end = 2
+            else:
+                end = len(data) + 1
+                message[1:end] = data
+            self.i2c.writeto(self.ADDRESS, message, end=end)
+            if settle:
+                time.sleep(settle)
             return True
         except Exception as e:
-            print(f"I2C Write Error: {e}")
+            log.error("I2C Write Error: %s", e)
             return False
 
-    def _read_reg(self, reg, nbytes=1):
+    def _write_reg_debug(self, reg, data, settle=0.0):
         """
-        Read from a register via I2C
+        _write_reg that also logs the bytes written
         """
-        try:
-            result = bytearray(nbytes)
-            self.i2c.writeto_then_readfrom(self.ADDRESS, bytes([reg]), result)
-            if self.debug:
-                print(f"Read from reg {hex(reg)}: {[hex(x) for x in result]}")
-            return result
-        except Exception as e:
-            print(f"I2C Read Error: {e}")
-            return None
+        ok = type(self)._write_reg(self, reg, data, settle)
+        if ok:
+            message = [reg] + ([data] if isinstance(data, int) else list(data))
+            log.debug("Write to reg %s: %s", hex(reg), [hex(x) for x in message])
+        return ok
+
+    def _block_write(self, reg, data):
+        """
+        Write data to consecutive registers starting at reg: point the
+        address pointer at reg, then block-write the bytes. I2C errors
+        propagate to the caller.
+        """
+        out = self._tx
+        out[0] = self.CMD_ADDR_POINTER
+        out[1] = reg
+        self.i2c.writeto(self.ADDRESS, out, end=2)
+        end = len(data) + 2
+        out[0] = self.CMD_BLOCK_WRITE
+        out[1] = len(data)
+        out[2:end] = data
+        self.i2c.writeto(self.ADDRESS, out, end=end)
+
+    def _block_write_debug(self, reg, data):
+        """
+        _block_write that also logs the bytes written
+        """
+        type(self)._block_write(self, reg, data)
+        log.debug("Block write to reg %s: %s", hex(reg), [hex(x) for x in data])
+
+    def _writeto_debug(self, address, message):
+        """
+        Raw i2c.writeto that also logs the bytes written
+        """
+        self.i2c.writeto(address, message)
+        log.debug("Write to reg %s: %s", hex(message[0]),
+                  [hex(x) for x in message])
+
+    def _read_fast_debug(self, reg, buf):
+        """
+        _read_fast that also logs the bytes read
+        """
+        type(self)._read_fast(self, reg, buf)
+        log.debug("Read from reg %s: %s", hex(reg), [hex(x) for x in buf])
+        return buf
+
+    def _block_read_debug(self, reg, buf):
+        """
+        _block_read that also logs the bytes read
+        """
+        type(self)._block_read(self, reg, buf)
+        log.debug("Block read from reg %s: %s", hex(reg), [hex(x) for x in buf])
+        return buf
+
+    def _write_ctrl(self, cmd):
+        """
+        Write a control command together with the configured range/PGA bits
+        """
+        return self._write_reg(self.REG_CONTROL, cmd | self._ctrl_bits)
+
+    def _read_fast(self, reg, buf):
+        """
+        Read into buf for the per-point sweep path: no error wrapper or
+        allocation
+        """
+        out = self._tx
+        out[0] = reg
+        self.i2c.writeto_then_readfrom(self.ADDRESS, out, buf, out_end=1)
+        return buf
+
+    @staticmethod
+    def _wait_until(deadline):
+        """
+        Wait until time.monotonic() reaches deadline.
+
+        Sleeps for the bulk of the wait and spins through the last
+        millisecond, where scheduler jitter would otherwise overshoot.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining > 0.001:
+            time.sleep(remaining - 0.001)
+        while time.monotonic() < deadline:
+            pass
+
+    def _conversion_time(self, freq_hz):
+        """
+        Time (s) for the device to settle at freq_hz and run its DFT
+        """
+        return self.SETTLE_CYCLES / freq_hz + self.ADC_TIME
+
+    def _wait_status(self, mask, timeout):
+        """
+        Poll the status register until a bit in mask is set.
+
+        Starts with a short sleep and backs off, so a ready result is picked
+        up soon after it lands. Returns False if timeout (s) expires first.
+        """
+        read = self._read_fast
+        reg = self.REG_STATUS
+        buf = self._status
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while True:
+            if read(reg, buf)[0] & mask:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.005)
+
+    def _block_read(self, reg, buf):
+        """
+        Fill buf from consecutive registers starting at reg: point the
+        address pointer at reg, then block-read len(buf) bytes in one
+        combined write-then-read transaction
+        """
+        out = self._tx
+        out[0] = self.CMD_ADDR_POINTER
+        out[1] = reg
+        self.i2c.writeto(self.ADDRESS, out, end=2)
+        out[0] = self.CMD_BLOCK_READ
+        out[1] = len(buf)
+        self.i2c.writeto_then_readfrom(self.ADDRESS, out, buf, out_end=2)
+        return buf
+
+    def _read_sample(self):
+        """
+        Read and decode the real/imag result (0x94-0x97) in a single burst
+        """
+        return _unpack_sample(self._block_read(self.REG_REAL, self._sample))
+
+    def reset(self, settle=0.001):
+        """
+        Power the device down and return it to standby
+
+        :param settle: Seconds to wait after each control write
+        """
+        ok = self._write_reg(self.REG_CONTROL, self.CTRL_POWER_DOWN, settle=settle)
+        return self._write_reg(self.REG_CONTROL, self.CTRL_STANDBY, settle=settle) and ok
 
     def measure_temperature(self):
         """
         Measure device temperature
         """
         try:
-            # Trigger temperature measurement
-            self._write_reg(self.REG_CONTROL, 0x90)
-            # Wait for valid measurement
-            for _ in range(20):
-                status = self._read_reg(self.REG_STATUS)[0]
-                if status & 0x01:
-                    raw = self._read_reg(self.REG_TEMP_DATA, 2)
-                    if raw:
-                        raw_val = int.from_bytes(raw, 'big', signed=True)
-                        # See AD5933 datasheet for sign logic
-                        if raw_val & 0x2000:  # negative
-                            temp_c = (raw_val - 16384) / 32.0
-                        else:
-                            temp_c = raw_val / 32.0
-                        return round(temp_c, 2)
-                time.sleep(0.05)
-            return None
+            # Trigger temperature measurement and wait out the conversion,
+            # so the first status read below normally finds it valid
+            t0 = time.monotonic()
+            self._write_reg(self.REG_CONTROL, self.CTRL_MEAS_TEMP)
+            self._wait_until(t0 + self.TEMP_TIME)
+            # Confirm valid measurement, backing off if it is late. Status
+            # (0x8F) and temperature (0x92-0x93) are not contiguous, so the
+            # two stay separate reads.
+            if not self._wait_status(self.STATUS_TEMP_VALID, timeout=1.0):
+                return None
+            raw = self._block_read(self.REG_TEMP_DATA, self._temp)
+            # 14-bit two's complement in D13..D0 (D15, D14 are don't-care);
+            # sign-extend without branching
+            raw_val = struct.unpack('>H', raw)[0] & 0x3FFF
+            temp_c = ((raw_val ^ 0x2000) - 0x2000) / 32.0
+            return round(temp_c, 2)
         except Exception as e:
-            print(f"Temperature Measurement Error: {e}")
+            log.error("Temperature Measurement Error: %s", e)
             return None
 
     def configure_sweep(self, start_freq_hz, freq_incr_hz, num_increments,
@@ -105,10 +327,15 @@ class AD5933:
         Configure frequency sweep parameters
         """
         try:
-            # Reset device
-            self._write_reg(self.REG_CONTROL, self.CTRL_POWER_DOWN)
-            time.sleep(0.1)
-            self._write_reg(self.REG_CONTROL, self.CTRL_STANDBY)
+            # Settle and conversion times are computed per frequency, so
+            # every frequency in the sweep must be positive
+            end_freq_hz = start_freq_hz + num_increments * freq_incr_hz
+            if start_freq_hz <= 0 or end_freq_hz <= 0:
+                raise ValueError("Sweep frequencies must be above 0 Hz")
+            # The number-of-increments register is 9 bits wide
+            if not 0 <= num_increments <= self.MAX_INCREMENTS:
+                raise ValueError(
+                    f"Number of increments must be 0-{self.MAX_INCREMENTS}")
 
             # Range bits
             range_bits = {
@@ -119,45 +346,35 @@ class AD5933:
             }
             rb = range_bits.get(excitation_range_code, (0, 0))
 
-            # Build control register high byte
-            ctrl_high = (0xA << 4) | \
-                        ((rb[0] & 1) << 2) | \
-                        ((rb[1] & 1) << 1) | \
-                        (1 if pga_gain_x1 else 0)
-
-            # Write control register
-            self._write_reg(self.REG_CONTROL, [ctrl_high, 0x00])
-
-            # Calculate frequency codes (assuming 4MHz clock)
-            clock_freq = 4e6
-            start_code = int((start_freq_hz * (2**27)) / clock_freq)
-            incr_code = int((freq_incr_hz * (2**27)) / clock_freq)
-
-            # Write start frequency
-            self._write_reg(self.REG_START_FREQ, [
-                (start_code >> 16) & 0xFF,
-                (start_code >> 8) & 0xFF,
-                start_code & 0xFF
-            ])
-
-            # Write frequency increment
-            self._write_reg(self.REG_FREQ_INCR, [
-                (incr_code >> 16) & 0xFF,
-                (incr_code >> 8) & 0xFF,
-                incr_code & 0xFF
-            ])
-
-            # Write number of increments
-            self._write_reg(self.REG_NUM_INCR, [
-                (num_increments >> 8) & 0xFF,
-                num_increments & 0xFF
-            ])
-
-            # Settling cycles
-            self._write_reg(self.REG_SETTLE_CYCLES, [0x00, 0x0F])
+            # Range and PGA bits (D10-D8) share the control register's high
+            # byte with the command nibble, so every later command carries
+            # them too
+            self._ctrl_bits = ((rb[0] & 1) << 2) | \
+                              ((rb[1] & 1) << 1) | \
+                              (1 if pga_gain_x1 else 0)
+            ctrl_high = self.CTRL_STANDBY | self._ctrl_bits
+            self._cmd_incr = bytes((self.REG_CONTROL,
+                                    self.CTRL_INCR_FREQ | self._ctrl_bits))
+
+            # Calculate frequency codes: code = f * 2**27 / clock (exact ints)
+            start_code = (start_freq_hz << 27) // self.CLOCK_FREQ
+            incr_code = (freq_incr_hz << 27) // self.CLOCK_FREQ
+
+            # Control (standby), start freq, increment, number of increments
+            # and settling cycles occupy contiguous registers (0x80-0x8B), so
+            # write them all with one block write. A plain multi-byte write
+            # does not auto-increment on this part. Entering standby here
+            # also takes the place of a separate reset. A code too large
+            # for its 24-bit register raises OverflowError.
+            self._block_write(self.REG_CONTROL,
+                              bytes((ctrl_high, 0x00)) +
+                              start_code.to_bytes(3, 'big') +
+                              incr_code.to_bytes(3, 'big') +
+                              struct.pack('>HH', num_increments,
+                                          self.SETTLE_CYCLES))
             return True
         except Exception as e:
-            print(f"Sweep Configuration Error: {e}")
+            log.error("Sweep Configuration Error: %s", e)
             return False
 
     def sweep_generator(self, start_freq_hz, freq_incr_hz, num_increments,
@@ -172,40 +389,165 @@ class AD5933:
             return
 
         # Initialize with start frequency
-        self._write_reg(self.REG_CONTROL, self.CTRL_INIT_START)
-        time.sleep(0.02)
-
-        # Start sweep
-        self._write_reg(self.REG_CONTROL, self.CTRL_START_SWEEP)
-        time.sleep(0.02)
+        self._write_ctrl(self.CTRL_INIT_START)
+
+        # Start sweep, then wait out the first conversion
+        t0 = time.monotonic()
+        self._write_ctrl(self.CTRL_START_SWEEP)
+        self._wait_until(t0 + self._conversion_time(start_freq_hz))
+
+        # Bind per-point lookups once, outside the loop
+        wait_status = self._wait_status
+        read_sample = self._read_sample
+        writeto = self._writeto
+        address = self.ADDRESS
+        cmd_incr = self._cmd_incr
+        wait_until = self._wait_until
+        conversion_time = self._conversion_time
+        monotonic = time.monotonic
+        hypot = math.hypot
+        DATA_VALID = self.STATUS_DATA_VALID
 
         # Collect data points
         for i in range(num_increments + 1):
-            # Wait for valid data
-            for _ in range(20):
-                status = self._read_reg(self.REG_STATUS)[0]
-                if status & 0x02:  # Data ready
-                    break
-                time.sleep(0.002)
+            freq = start_freq_hz + i * freq_incr_hz
 
-            # Read real/imag
-            raw_real = self._read_reg(self.REG_REAL, 2)
-            raw_imag = self._read_reg(self.REG_IMAG, 2)
-            real_val = int.from_bytes(raw_real, 'big', signed=True)
-            imag_val = int.from_bytes(raw_imag, 'big', signed=True)
+            # Wait for valid data; reading without it would return the
+            # previous point's result
+            if not wait_status(DATA_VALID, timeout=0.04):
+                raise TimeoutError(f"AD5933 data not ready at {freq} Hz")
 
-            freq = start_freq_hz + i * freq_incr_hz
-            magnitude = math.sqrt(real_val**2 + imag_val**2)
+            # Read real/imag
+            real_val, imag_val = read_sample()
+            magnitude = hypot(real_val, imag_val)
 
             # --- YIELD the data point back to the caller ---
-            yield (freq, real_val, imag_val, magnitude)
+            try:
+                yield (freq, real_val, imag_val, magnitude)
+            except GeneratorExit:
+                # Closed before the end (e.g. cancelled): power the device
+                # down instead of leaving it mid-sweep
+                self.reset()
+                raise
 
             # Increment frequency unless it's the last point
             if i < num_increments:
-                self._write_reg(self.REG_CONTROL, self.CTRL_INCR_FREQ)
-                time.sleep(0.005)
+                t0 = monotonic()
+                writeto(address, cmd_incr)
+                wait_until(t0 + conversion_time(freq + freq_incr_hz))
+
+class AsyncAD5933(AD5933):
+    """
+    asyncio variant of the AD5933 driver
+
+    Blocking I2C transfers run in the loop's default executor and all waits
+    are asyncio.sleep, so other tasks keep running while the device settles.
+    The driver's transfer buffers are shared, so each public operation holds
+    a lock for its whole duration (a sweep until it finishes or is closed)
+    and overlapping calls wait their turn. The synchronous AD5933 API is
+    inherited unchanged and is not covered by the lock.
+    """
+
+    def __init__(self, i2c_bus, debug=False):
+        super().__init__(i2c_bus, debug)
+        self._bus_lock = asyncio.Lock()
+
+    async def _run(self, func, *args):
+        """
+        Run a blocking driver call in the default executor
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def _write_reg_async(self, reg, data, settle=0.0):
+        """
+        Awaitable _write_reg; the settle time is an asyncio.sleep.
+        The caller must hold _bus_lock.
+        """
+        ok = await self._run(self._write_reg, reg, data)
+        if settle:
+            await asyncio.sleep(settle)
+        return ok
+
+    async def _wait_status_async(self, mask, timeout):
+        """
+        Awaitable counterpart of _wait_status with the same backoff.
+        The caller must hold _bus_lock.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = 0.0005
+        while True:
+            status = await self._run(self._read_fast, self.REG_STATUS,
+                                     self._status)
+            if status[0] & mask:
+                return True
+            if loop.time() >= deadline:
+                return False
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.5, 0.005)
+
+    async def measure_temperature_async(self):
+        """
+        Measure device temperature without blocking the event loop
+        """
+        async with self._bus_lock:
+            return await self._run(self.measure_temperature)
+
+    async def sweep(self, start_freq_hz, freq_incr_hz, num_increments,
+                    pga_gain_x1=True, excitation_range_code=1):
+        """
+        Async generator version of sweep_generator; use with `async for`.
+        I2C errors during the sweep propagate, as in sweep_generator.
+        """
+        async with self._bus_lock:
+            if not await self._run(self.configure_sweep, start_freq_hz,
+                                   freq_incr_hz, num_increments,
+                                   pga_gain_x1, excitation_range_code):
+                return
+
+            ctrl_bits = self._ctrl_bits
+            await self._write_reg_async(self.REG_CONTROL,
+                                        self.CTRL_INIT_START | ctrl_bits)
+            await self._write_reg_async(
+                self.REG_CONTROL, self.CTRL_START_SWEEP | ctrl_bits,
+                settle=self._conversion_time(start_freq_hz))
+
+            for i in range(num_increments + 1):
+                freq = start_freq_hz + i * freq_incr_hz
+                if not await self._wait_status_async(self.STATUS_DATA_VALID,
+                                                     timeout=0.04):
+                    raise TimeoutError(f"AD5933 data not ready at {freq} Hz")
+                real_val, imag_val = await self._run(self._read_sample)
+                magnitude = math.hypot(real_val, imag_val)
+                try:
+                    yield (freq, real_val, imag_val, magnitude)
+                except GeneratorExit:
+                    await self._run(self.reset)
+                    raise
+
+                if i < num_increments:
+                    # Raw write, as in sweep_generator: a failed increment
+                    # raises instead of re-reading the previous point
+                    await self._run(self._writeto, self.ADDRESS,
+                                    self._cmd_incr)
+                    await asyncio.sleep(
+                        self._conversion_time(freq + freq_incr_hz))
 
 class AD5933GUI:
+    # Fraction of the magnitude span left free above and below the trace, so
+    # new sweep points usually land inside the current axes
+    MAG_HEADROOM = 0.05
+    # Point markers are drawn only up to this many points; past it the
+    # polyline alone shows the trace
+    MARKER_LIMIT = 100
+    # How often (ms) the GUI collects points from the sweep worker thread
+    SWEEP_POLL_MS = 20
+    # Minimum time (ms) between live plot updates, ~30 frames per second
+    PLOT_FRAME_MS = 33
+    # Quiet time (ms) after the last resize event before the plot is redrawn
+    RESIZE_DELAY_MS = 100
+
     def __init__(self, master):
         """
         Initialize the GUI
@@ -219,19 +561,27 @@ class AD5933GUI:
         
         tk.Label(frm_i2c, text="SCL Pin:").grid(row=0, column=0, sticky="e")
         self.scl_var = tk.StringVar(value="board.SCL")
-        self.scl_entry = tk.Entry(frm_i2c, textvariable=self.scl_var, width=15)
+        self.scl_entry = ttk.Combobox(frm_i2c, textvariable=self.scl_var,
+                                      postcommand=self._fill_pin_lists, width=15)
         self.scl_entry.grid(row=0, column=1, padx=5)
         
         tk.Label(frm_i2c, text="SDA Pin:").grid(row=0, column=2, sticky="e")
         self.sda_var = tk.StringVar(value="board.SDA")
-        self.sda_entry = tk.Entry(frm_i2c, textvariable=self.sda_var, width=15)
+        self.sda_entry = ttk.Combobox(frm_i2c, textvariable=self.sda_var,
+                                      postcommand=self._fill_pin_lists, width=15)
         self.sda_entry.grid(row=0, column=3, padx=5)
+
+        # Bus clock; drop to 100000 for long or weakly pulled-up wiring
+        tk.Label(frm_i2c, text="I2C Hz:").grid(row=0, column=4, sticky="e")
+        self.frequency_var = tk.StringVar(value=str(AD5933.I2C_FREQUENCY))
+        self.frequency_entry = tk.Entry(frm_i2c, textvariable=self.frequency_var, width=8)
+        self.frequency_entry.grid(row=0, column=5, padx=5)
         
         self.btn_connect = tk.Button(frm_i2c, text="Connect", command=self.connect_i2c)
-        self.btn_connect.grid(row=0, column=4, padx=5)
+        self.btn_connect.grid(row=0, column=6, padx=5)
         
         self.i2c_label = tk.Label(frm_i2c, text="Not Connected")
-        self.i2c_label.grid(row=0, column=5, padx=5)
+        self.i2c_label.grid(row=0, column=7, padx=5)
 
         # Sweep Configuration Frame
         frm_cfg = tk.Frame(master)
@@ -242,7 +592,9 @@ class AD5933GUI:
             ("Freq Incr (Hz)", "incr_freq_entry", "100"),
             ("# Points",        "num_points_entry", "50"),
             ("Range",          "range_entry",       "1"),
-            ("PGA (0=×5, 1=×1)","pga_entry",        "1")
+            ("PGA (0=×5, 1=×1)","pga_entry",        "1"),
+            # 0 picks a step giving ~50 plot updates per sweep
+            ("Redraw every N",  "redraw_every_entry", "0")
         ]
 
         for i, (label, attr, default) in enumerate(config_params):
@@ -259,34 +611,96 @@ class AD5933GUI:
                                    command=self.start_sweep, state=tk.DISABLED)
         self.btn_sweep.grid(row=2, column=4, padx=5)
 
+        self.btn_cancel = tk.Button(frm_cfg, text="Cancel",
+                                    command=self.cancel_sweep, state=tk.DISABLED)
+        self.btn_cancel.grid(row=2, column=3, padx=5)
+
         self.temp_label = tk.Label(frm_cfg, text="Temp: --- °C")
         self.temp_label.grid(row=2, column=5, padx=5)
 
-        # Canvas for plotting
-        self.canvas = tk.Canvas(master, width=600, height=300, bg="white")
-        self.canvas.pack(pady=5)
-
-        # Data storage
-        self.data_points = []
+        # Canvas for plotting; it follows the window size. The size is kept
+        # in Python, updated on <Configure>, so redraws skip the Tcl option
+        # reads. No highlight border, so the event size is the drawing area.
+        self._cw, self._ch = 600, 300
+        self.canvas = tk.Canvas(master, width=self._cw, height=self._ch,
+                                bg="white", highlightthickness=0)
+        self.canvas.pack(pady=5, fill=tk.BOTH, expand=True)
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+        self._resize_job = None
+
+        # Data storage: one typed array per column (frequency, real, imag,
+        # magnitude) rather than a list of per-point tuples
+        self.freqs = array('d')
+        self.reals = array('h')
+        self.imags = array('h')
+        self.mags = array('d')
         self.freq_min = float('inf')
         self.freq_max = float('-inf')
         self.mag_min = float('inf')
         self.mag_max = float('-inf')
+        # Set when a sample widened the bounds since the plot was last updated
+        self._bounds_dirty = False
+
+        # Incremental plotting state: axis bounds and (scale, offset) pairs
+        # of the last full redraw, last point drawn, number of samples on
+        # the plot and how many to collect per update
+        self._view = None
+        self._maps = None
+        self._last_xy = None
+        self._plotted = 0
+        self._redraw_every = 1
+        # Set while a plot update is scheduled but has not run yet
+        self._plot_pending = False
+
+        # Bode transform of the data so far: [log10(freq) column, dB column,
+        # samples transformed, log min, log max, dB min, dB max]
+        self._bode_cache = None
+
+        # Persistent axis/tick/label item IDs, the plot kind they belong to
+        # and the axes/canvas size they were last laid out for
+        self._static_items = {}
+        self._static_kind = None
+        self._axis_key = None
+        # Kind, canvas size, sample count and axes of the last full redraw
+        self._draw_key = None
+        # Persistent polyline item of the data trace
+        self._trace_id = None
 
         # I2C/AD5933 references
         self.i2c_bus = None
         self.ad5933 = None
+        # Point queue and cancel flag of the sweep in progress (queue is
+        # None when idle)
+        self._sweep_queue = None
+        self._sweep_cancel = None
 
     def connect_i2c(self):
         """
         Connect to I2C bus
         """
         try:
-            scl_pin = eval(self.scl_var.get())
-            sda_pin = eval(self.sda_var.get())
+            # Blinka raises ImportError when missing, and NotImplementedError
+            # or RuntimeError on a board or platform it does not support
+            try:
+                import busio
+                pins = pin_map()
+            except Exception as e:
+                raise RuntimeError(
+                    f"I2C support is not available ({e}); check that Adafruit "
+                    "Blinka is installed and supports this board"
+                ) from e
+
+            scl_pin = pins.get(self.scl_var.get())
+            sda_pin = pins.get(self.sda_var.get())
+            if scl_pin is None or sda_pin is None:
+                raise ValueError("Choose SCL and SDA pins from the list")
             
-            self.i2c_bus = busio.I2C(scl_pin, sda_pin)
-            self.ad5933 = AD5933(self.i2c_bus, debug=True)
+            frequency = int(self.frequency_var.get())
+            
+            self.i2c_bus = busio.I2C(scl_pin, sda_pin, frequency=frequency)
+            # Register tracing only when debug logging is enabled
+            self.ad5933 = AD5933(self.i2c_bus,
+                                 debug=log.isEnabledFor(logging.DEBUG))
             
             self.i2c_label.config(text="Connected")
             self.btn_connect.config(state=tk.DISABLED)
@@ -298,9 +712,44 @@ class AD5933GUI:
                 self.temp_label.config(text=f"Temp: {temp:.2f}°C")
 
         except Exception as e:
-            print(f"I2C Connection Error: {e}")
+            log.error("I2C Connection Error: %s", e)
             messagebox.showerror("Connection Error", str(e))
 
+    def _fill_pin_lists(self):
+        """
+        Load the pin choices into the SCL/SDA lists when one is opened
+        """
+        try:
+            names = list(pin_map())
+        except Exception as e:
+            # Leave the lists empty; connect_i2c reports the problem
+            log.warning("Board pins unavailable: %s", e)
+            names = []
+        self.scl_entry.config(values=names)
+        self.sda_entry.config(values=names)
+
+    def _on_canvas_resize(self, event):
+        """
+        Track the canvas size and redraw the plot once resizing settles
+        """
+        if (event.width, event.height) == (self._cw, self._ch):
+            return
+        self._cw, self._ch = event.width, event.height
+        if self._resize_job is not None:
+            self.master.after_cancel(self._resize_job)
+        self._resize_job = self.master.after(self.RESIZE_DELAY_MS,
+                                             self._redraw_after_resize)
+
+    def _redraw_after_resize(self):
+        """
+        Redraw whichever plot style is on the canvas at the new size
+        """
+        self._resize_job = None
+        if self._static_kind == "bode":
+            self.redraw_bode_plot()
+        else:
+            self.redraw_plot()
+
     ###
     # 1) Method to clear data and canvas before a new sweep
     ###
@@ -308,173 +757,327 @@ class AD5933GUI:
         """
         Clear any old data and reset the canvas
         """
-        self.data_points.clear()
+        self.freqs = array('d')
+        self.reals = array('h')
+        self.imags = array('h')
+        self.mags = array('d')
         self.freq_min = float('inf')
         self.freq_max = float('-inf')
         self.mag_min = float('inf')
         self.mag_max = float('-inf')
+        self._bounds_dirty = False
+        self._view = None
+        self._last_xy = None
+        self._plotted = 0
+        self._bode_cache = None
+        self._static_kind = None
+        self._axis_key = None
+        self._draw_key = None
+        self._trace_id = None
         self.canvas.delete("all")
 
+    def _plot_view(self):
+        """
+        Axis bounds for the magnitude plot: the frequency bounds, and the
+        magnitude range padded by MAG_HEADROOM
+        """
+        freq_lo, freq_hi = self.freq_min, self.freq_max
+        margin = ((self.mag_max - self.mag_min) * self.MAG_HEADROOM
+                  or abs(self.mag_max) * self.MAG_HEADROOM or 1.0)
+        return freq_lo, freq_hi, self.mag_min - margin, self.mag_max + margin
+
     ###
     # 2) Method to plot data on the Tkinter canvas
     ###
+    def _draw_axes(self, kind, w, h, padding, x_ticks, y_ticks, y_label):
+        """
+        Draw the axes, tick marks and labels shared by both plot styles.
+
+        x_ticks / y_ticks are lists of (canvas position, label text). The
+        canvas items are created once per plot kind and later redraws only
+        move and relabel them with coords()/itemconfig().
+        """
+        canvas = self.canvas
+        items = self._static_items
+        if self._static_kind != kind:
+            canvas.delete("static")
+            items.clear()
+
+            def line():
+                return canvas.create_line(0, 0, 0, 0, fill="black", tags="static")
+
+            items['x_axis'] = line()
+            items['y_axis'] = line()
+            items['x_ticks'] = [(line(), canvas.create_text(
+                0, 0, anchor="n", tags="static")) for _ in x_ticks]
+            items['y_ticks'] = [(line(), canvas.create_text(
+                0, 0, anchor="e", tags="static")) for _ in y_ticks]
+            items['x_label'] = canvas.create_text(
+                0, 0, text="Frequency (Hz)", anchor="s",
+                font=("Arial", 12, "bold"), tags="static")
+            items['y_label'] = canvas.create_text(
+                0, 0, text=y_label, anchor="center", angle=90,
+                font=("Arial", 12, "bold"), tags="static")
+            self._static_kind = kind
+
+        canvas.coords(items['x_axis'], padding, h - padding, w - padding, h - padding)
+        canvas.coords(items['y_axis'], padding, padding, padding, h - padding)
+        for (tick_id, text_id), (x_pos, label) in zip(items['x_ticks'], x_ticks):
+            # Short tick line with its numeric label underneath
+            canvas.coords(tick_id, x_pos, h - padding, x_pos, h - padding + 5)
+            canvas.coords(text_id, x_pos, h - padding + 15)
+            canvas.itemconfig(text_id, text=label)
+        for (tick_id, text_id), (y_pos, label) in zip(items['y_ticks'], y_ticks):
+            canvas.coords(tick_id, padding - 5, y_pos, padding, y_pos)
+            canvas.coords(text_id, padding - 10, y_pos)
+            canvas.itemconfig(text_id, text=label)
+        canvas.coords(items['x_label'], w // 2, h - 5)
+        canvas.coords(items['y_label'], 15, h // 2)
+
     def redraw_plot(self):
         """
         Plot the magnitude vs frequency using the Tkinter Canvas.
         """
-        if len(self.data_points) < 2 or self.freq_min >= self.freq_max:
+        if len(self.freqs) < 2:
+            return
+        freq_lo, freq_hi, mag_lo, mag_hi = view = self._plot_view()
+        if freq_lo >= freq_hi:
+            return
+
+        w, h = self._cw, self._ch
+        # Nothing to do if the same data is already drawn on the same axes
+        draw_key = ("linear", w, h, len(self.freqs), view)
+        if draw_key == self._draw_key:
             return
 
-        w = int(self.canvas["width"])
-        h = int(self.canvas["height"])
         padding = 40
         plot_w = w - 2 * padding
         plot_h = h - 2 * padding
 
-        self.canvas.delete("all")
+        self.canvas.delete("data")
 
-        # Draw X-axis
-        self.canvas.create_line(padding, h - padding, w - padding, h - padding, fill="black")
-        # Draw Y-axis
-        self.canvas.create_line(padding, padding, padding, h - padding, fill="black")
+        # Data-to-canvas mapping as one scale and offset per axis, so the
+        # trace below is mapped with inline arithmetic, not calls per point
+        sx = plot_w / (freq_hi - freq_lo)
+        ox = padding - freq_lo * sx
+        # Higher magnitude => lower on canvas
+        sy = -plot_h / (mag_hi - mag_lo)
+        oy = (h - padding) - mag_lo * sy
 
         def x_map(freq):
-            return padding + (freq - self.freq_min) / (self.freq_max - self.freq_min) * plot_w
+            return ox + freq * sx
 
         def y_map(mag):
-            # Higher magnitude => lower on canvas
-            return (h - padding) - (mag - self.mag_min) / (self.mag_max - self.mag_min) * plot_h
-
-        num_x_ticks = 5  # or however many you want
-        for i in range(num_x_ticks + 1):
-            # Interpolate between freq_min and freq_max
-            freq_value = self.freq_min + i * (self.freq_max - self.freq_min) / num_x_ticks
-            x_pos = x_map(freq_value)
-            # Short tick line
-            self.canvas.create_line(x_pos, h - padding, x_pos, h - padding + 5, fill="black")
-            # Numeric label under the tick
-            self.canvas.create_text(x_pos, h - padding + 15,
-                                    text=f"{freq_value:.0f}",
-                                    anchor="n")
-
-        num_y_ticks = 5
-        for i in range(num_y_ticks + 1):
-            mag_value = self.mag_min + i * (self.mag_max - self.mag_min) / num_y_ticks
-            y_pos = y_map(mag_value)
-            # Short tick
-            self.canvas.create_line(padding - 5, y_pos, padding, y_pos, fill="black")
-            # Numeric label
-            self.canvas.create_text(padding - 10, y_pos,
-                                    text=f"{mag_value:.2f}",
-                                    anchor="e")
-
-        # 4) Axis labels
-        # X-axis label
-        self.canvas.create_text(w // 2, h - 5, text="Frequency (Hz)", anchor="s", font=("Arial", 12, "bold"))
-        # Y-axis label - rotate if you want vertical text
-        self.canvas.create_text(15, h // 2, text="Magnitude", anchor="center", angle=90,
-                                font=("Arial", 12, "bold"))
-
-        prev_x = None
-        prev_y = None
-        for (freq, real_val, imag_val, mag) in self.data_points:
-            x = x_map(freq)
-            y = y_map(mag)
-            self.canvas.create_oval(x-2, y-2, x+2, y+2, fill="blue")
-            if prev_x is not None:
-                self.canvas.create_line(prev_x, prev_y, x, y, fill="blue")
-            prev_x, prev_y = x, y
+            return oy + mag * sy
+
+        # Ticks and labels depend only on the axes and canvas size; skip
+        # rebuilding them when neither changed since the last redraw
+        axis_key = ("linear", view, w, h)
+        if axis_key != self._axis_key:
+            x_ticks = [(x_map(value), label) for value, label
+                       in _tick_labels(freq_lo, freq_hi, 5, ".0f")]
+            y_ticks = [(y_map(value), label) for value, label
+                       in _tick_labels(mag_lo, mag_hi, 5, ".2f")]
+
+            self._draw_axes("linear", w, h, padding, x_ticks, y_ticks, "Magnitude")
+            self._axis_key = axis_key
+
+        coords = [c for freq, mag in zip(self.freqs, self.mags)
+                  for c in (ox + freq * sx, oy + mag * sy)]
+        self._draw_trace(coords, "blue")
+
+        # Remember the axes so later samples can be appended in place
+        self._view = view
+        self._maps = (sx, ox, sy, oy)
+        self._last_xy = (coords[-2], coords[-1])
+        self._plotted = len(self.freqs)
+        self._draw_key = draw_key
+
+    def _draw_trace(self, coords, color):
+        """
+        Draw a data trace from flat [x0, y0, x1, y1, ...] coordinates as a
+        single polyline, with point markers for short traces. The polyline
+        is one persistent item, moved with coords() on every redraw.
+        """
+        points = self._decimate(coords)
+        if self._trace_id is None:
+            self._trace_id = self.canvas.create_line(*points, fill=color,
+                                                     tags="trace")
+        else:
+            self.canvas.coords(self._trace_id, *points)
+            self.canvas.itemconfig(self._trace_id, fill=color)
+        if len(coords) <= 2 * self.MARKER_LIMIT:
+            for i in range(0, len(coords), 2):
+                x, y = coords[i], coords[i + 1]
+                self.canvas.create_oval(x - 2, y - 2, x + 2, y + 2,
+                                        fill=color, tags="data")
+
+    @staticmethod
+    def _decimate(coords):
+        """
+        Thin flat [x0, y0, x1, y1, ...] coordinates to the first, last,
+        highest and lowest point of each pixel column, in drawing order.
+        Dense traces keep their envelope with at most four vertices per
+        column.
+        """
+        if len(coords) <= 8:
+            return coords
+        keep = []
+        col = None
+        for i in range(0, len(coords), 2):
+            xi = int(coords[i])
+            if xi != col:
+                if col is not None:
+                    keep.extend(sorted({first, lo, hi, last}))
+                col = xi
+                first = lo = hi = last = i
+            else:
+                last = i
+                if coords[i + 1] < coords[lo + 1]:
+                    lo = i
+                elif coords[i + 1] > coords[hi + 1]:
+                    hi = i
+        keep.extend(sorted({first, lo, hi, last}))
+
+        if len(keep) * 2 == len(coords):
+            return coords
+        return [c for i in keep for c in (coords[i], coords[i + 1])]
+
+    def plot_pending(self):
+        """
+        Add the samples stored since the last update to the magnitude plot.
+        Only their markers and connecting segments are drawn while they fit
+        the current axes; otherwise the plot is redrawn with redraw_plot.
+        """
+        start = self._plotted
+        n = len(self.freqs)
+        if start >= n:
+            return
+        self._plotted = n
+
+        view = self._view
+        # The bounds cover every stored sample, so comparing them with the
+        # view tells whether any of the new ones falls outside it; only
+        # needed when they moved since the last update
+        dirty = self._bounds_dirty
+        self._bounds_dirty = False
+        if (view is None
+                or dirty and (self.freq_min < view[0] or self.freq_max > view[1]
+                              or self.mag_min < view[2] or self.mag_max > view[3])
+                # Crossing the marker limit: repaint without markers
+                or start <= self.MARKER_LIMIT < n):
+            self.redraw_plot()
+            return
+
+        sx, ox, sy, oy = self._maps
+        coords = [c for freq, mag in zip(self.freqs[start:], self.mags[start:])
+                  for c in (ox + freq * sx, oy + mag * sy)]
+        if n <= self.MARKER_LIMIT:
+            for i in range(0, len(coords), 2):
+                x, y = coords[i], coords[i + 1]
+                self.canvas.create_oval(x-2, y-2, x+2, y+2, fill="blue", tags="data")
+        if self._last_xy is not None:
+            self.canvas.create_line(*self._last_xy, *coords, fill="blue", tags="data")
+        self._last_xy = (coords[-2], coords[-1])
 
     def redraw_bode_plot(self):
         """
         Example: Bode plot style, with magnitude in dB vs. log(frequency).
         """
-        if len(self.data_points) < 2:
+        if len(self.freqs) < 2:
             return
-
-        # 1) Transform data into log(f) and dB(mag)
-        transformed_points = []
-        for (freq, real_val, imag_val, mag) in self.data_points:
-            if freq <= 0:
-                continue
-            freq_log = math.log10(freq)
-            mag_db = 20 * math.log10(mag + 1e-12)
-            transformed_points.append((freq_log, mag_db))
-
-        if not transformed_points:
+        w, h = self._cw, self._ch
+        draw_key = ("bode", w, h, len(self.freqs))
+        if draw_key == self._draw_key:
             return
 
-        # 2) Find min/max in log(freq) and dB(mag)
-        freq_log_min = min(p[0] for p in transformed_points)
-        freq_log_max = max(p[0] for p in transformed_points)
-        mag_db_min   = min(p[1] for p in transformed_points)
-        mag_db_max   = max(p[1] for p in transformed_points)
+        # 1) Transform data into log(f) and dB(mag) columns and 2) find
+        # their min/max. Samples are only ever appended, so just the ones
+        # added since the last redraw need transforming.
+        cache = self._bode_cache
+        if cache is None:
+            cache = self._bode_cache = [array('d'), array('d'), 0,
+                                        float('inf'), float('-inf'),
+                                        float('inf'), float('-inf')]
+        freq_logs, mags_db, done = cache[0], cache[1], cache[2]
+        n = len(self.freqs)
+        if done < n:
+            first = len(freq_logs)
+            log10 = math.log10
+            for freq, mag in zip(self.freqs[done:], self.mags[done:]):
+                if freq <= 0:
+                    continue
+                freq_logs.append(log10(freq))
+                mags_db.append(20 * log10(mag + 1e-12))
+            cache[2] = n
+
+            if len(freq_logs) > first:
+                new_logs = freq_logs[first:]
+                new_dbs = mags_db[first:]
+                cache[3:7] = (min(cache[3], min(new_logs)),
+                              max(cache[4], max(new_logs)),
+                              min(cache[5], min(new_dbs)),
+                              max(cache[6], max(new_dbs)))
+
+        if not freq_logs:
+            return
+        freq_log_min, freq_log_max, mag_db_min, mag_db_max = cache[3:7]
 
         # If there's no range, bail
         if freq_log_min == freq_log_max:
             return
 
-        w = int(self.canvas["width"])
-        h = int(self.canvas["height"])
         padding = 40
         plot_w = w - 2 * padding
         plot_h = h - 2 * padding
 
-        self.canvas.delete("all")
+        self.canvas.delete("data")
+        self._view = None  # magnitude plot items are gone
 
-        # Draw axes
-        self.canvas.create_line(padding, h - padding, w - padding, h - padding, fill="black")  # X-axis
-        self.canvas.create_line(padding, padding, padding, h - padding, fill="black")          # Y-axis
+        # fl is log10(freq)
+        sx = plot_w / (freq_log_max - freq_log_min)
+        ox = padding - freq_log_min * sx
+        # bigger dB => lower on canvas
+        sy = -plot_h / (mag_db_max - mag_db_min)
+        oy = (h - padding) - mag_db_min * sy
 
         def x_map(fl):
-            # fl is log10(freq)
-            return padding + (fl - freq_log_min) / (freq_log_max - freq_log_min) * plot_w
+            return ox + fl * sx
 
         def y_map(db):
-            # bigger dB => lower on canvas
-            return (h - padding) - (db - mag_db_min) / (mag_db_max - mag_db_min) * plot_h
-
-        # Ticks for x-axis (log scale in base 10)
-        num_x_ticks = 5
-        for i in range(num_x_ticks + 1):
-            fl_val = freq_log_min + i * (freq_log_max - freq_log_min) / num_x_ticks
-            x_pos = x_map(fl_val)
-            # Convert back to linear for labeling
-            freq_val = 10 ** fl_val
-            self.canvas.create_line(x_pos, h - padding, x_pos, h - padding + 5, fill="black")
-            self.canvas.create_text(x_pos, h - padding + 15, text=f"{freq_val:.0f}", anchor="n")
-
-        # Ticks for y-axis (dB)
-        num_y_ticks = 6
-        for i in range(num_y_ticks + 1):
-            db_val = mag_db_min + i * (mag_db_max - mag_db_min) / num_y_ticks
-            y_pos = y_map(db_val)
-            self.canvas.create_line(padding - 5, y_pos, padding, y_pos, fill="black")
-            self.canvas.create_text(padding - 10, y_pos, text=f"{db_val:.1f}", anchor="e")
-
-        # Axis Labels
-        self.canvas.create_text(w // 2, h - 5, text="Frequency (Hz)", anchor="s", font=("Arial", 12, "bold"))
-        self.canvas.create_text(15, h // 2, text="Magnitude (dB)", anchor="center",
-                                angle=90, font=("Arial", 12, "bold"))
+            return oy + db * sy
+
+        axis_key = ("bode", freq_log_min, freq_log_max, mag_db_min, mag_db_max, w, h)
+        if axis_key != self._axis_key:
+            # Ticks for x-axis (log scale in base 10, labelled in Hz)
+            x_ticks = [(x_map(value), label) for value, label
+                       in _tick_labels(freq_log_min, freq_log_max, 5, ".0f",
+                                       log_scale=True)]
+            # Ticks for y-axis (dB)
+            y_ticks = [(y_map(value), label) for value, label
+                       in _tick_labels(mag_db_min, mag_db_max, 6, ".1f")]
+
+            self._draw_axes("bode", w, h, padding, x_ticks, y_ticks, "Magnitude (dB)")
+            self._axis_key = axis_key
 
         # Plot the data
-        prev_x = None
-        prev_y = None
-        for (fl, db) in transformed_points:
-            x = x_map(fl)
-            y = y_map(db)
-            self.canvas.create_oval(x - 2, y - 2, x + 2, y + 2, fill="red")
-            if prev_x is not None:
-                self.canvas.create_line(prev_x, prev_y, x, y, fill="red")
-            prev_x, prev_y = x, y
+        self._draw_trace([c for fl, db in zip(freq_logs, mags_db)
+                          for c in (ox + fl * sx, oy + db * sy)], "red")
+        self._draw_key = draw_key
 
     def start_sweep(self):
         """
         Start impedance sweep, updating the plot in real time.
+
+        The sweep runs on a worker thread (_sweep_worker) and the Tk side
+        plots its points in batches (_drain_sweep), so I2C timing never
+        blocks the window and the sweep can be cancelled.
         """
         if not self.ad5933:
             messagebox.showerror("Error", "Not connected to I2C!")
             return
+        if self._sweep_queue is not None:
+            return
 
         # Clear old data/plot
         self.reset_plot()
@@ -486,6 +1089,7 @@ class AD5933GUI:
             num_points = int(self.num_points_entry.get())
             range_code = int(self.range_entry.get())
             pga_mode = bool(int(self.pga_entry.get()))
+            redraw_every = int(self.redraw_every_entry.get())
 
             # Optional temperature read before
             temp_before = self.ad5933.measure_temperature()
@@ -494,6 +1098,23 @@ class AD5933GUI:
             else:
                 self.temp_label.config(text="Temp: ??? °C")
 
+            # The sweep's frequencies are known up front, so the frequency
+            # bounds (and the plot's frequency axis) are fixed from the start
+            # and only the magnitude bounds move as points arrive
+            end_freq = start_freq + num_points * freq_incr
+            if start_freq <= 0 or end_freq <= 0:
+                raise ValueError("Sweep frequencies must be above 0 Hz")
+            if not 0 <= num_points <= AD5933.MAX_INCREMENTS:
+                raise ValueError(
+                    f"# Points must be 0-{AD5933.MAX_INCREMENTS}")
+            self.freq_min = min(start_freq, end_freq)
+            self.freq_max = max(start_freq, end_freq)
+
+            # Plot in steps of redraw_every samples, ~50 steps per sweep by default
+            if redraw_every <= 0:
+                redraw_every = max(1, num_points // 50)
+            self._redraw_every = redraw_every
+
             # Create the generator
             gen = self.ad5933.sweep_generator(
                 start_freq,
@@ -503,41 +1124,137 @@ class AD5933GUI:
                 excitation_range_code=range_code
             )
 
-            # Iterate over each new data point
-            for (freq, real_val, imag_val, mag) in gen:
-                # Append to local data store
-                self.data_points.append((freq, real_val, imag_val, mag))
-
-                # Update min/max tracking
-                if freq < self.freq_min:
-                    self.freq_min = freq
-                if freq > self.freq_max:
-                    self.freq_max = freq
-                if mag < self.mag_min:
-                    self.mag_min = mag
-                if mag > self.mag_max:
-                    self.mag_max = mag
-
-                # Redraw the plot
-                self.redraw_plot()
-                # Give Tkinter a chance to update the window
-                self.master.update_idletasks()
-                # Or self.master.update() - but be cautious with potential re-entry
-                # Optionally add a small delay if you want slower updates
-                # time.sleep(0.02)
-
-            # Optional temperature read after
-            temp_after = self.ad5933.measure_temperature()
-            if temp_after is not None:
-                self.temp_label.config(text=f"Temp: {temp_after:.2f}°C")
-
-            print("SWEEP_DONE")
-
         except Exception as e:
             messagebox.showerror("Sweep Error", str(e))
+            return
+
+        # Run the generator on a worker thread; the Tk side drains its queue
+        self._sweep_queue = queue.Queue()
+        self._sweep_cancel = threading.Event()
+        threading.Thread(target=self._sweep_worker,
+                         args=(gen, self._sweep_queue, self._sweep_cancel),
+                         daemon=True).start()
+
+        self.btn_sweep.config(state=tk.DISABLED)
+        self.btn_cancel.config(state=tk.NORMAL)
+        self.master.after(self.SWEEP_POLL_MS, self._drain_sweep)
+
+    @staticmethod
+    def _sweep_worker(gen, points, cancel):
+        """
+        Run the sweep generator off the Tk thread, posting each point to the
+        points queue. The last item is None, or the exception that ended
+        the sweep. Never touches Tk.
+        """
+        result = None
+        try:
+            for point in gen:
+                points.put(point)
+                if cancel.is_set():
+                    break
+        except Exception as e:
+            result = e
+        finally:
+            gen.close()
+        points.put(result)
+
+    def _drain_sweep(self):
+        """
+        Plot every point the worker has queued since the last call, then
+        check back in SWEEP_POLL_MS; finish up once the worker is done.
+        """
+        points = self._sweep_queue
+        while True:
+            try:
+                item = points.get_nowait()
+            except queue.Empty:
+                break
+
+            if item is None or isinstance(item, Exception):
+                # Plot whatever is left of the last step
+                self.plot_pending()
+                cancelled = self._sweep_cancel.is_set()
+                self._end_sweep()
+                if item is not None:
+                    messagebox.showerror("Sweep Error", str(item))
+                    return
+                # Optional temperature read after
+                temp_after = self.ad5933.measure_temperature()
+                if temp_after is not None:
+                    self.temp_label.config(text=f"Temp: {temp_after:.2f}°C")
+                if not cancelled:
+                    print("SWEEP_DONE")
+                return
+
+            self._add_sample(*item)
+
+        self.master.after(self.SWEEP_POLL_MS, self._drain_sweep)
+
+    def _add_sample(self, freq, real_val, imag_val, mag):
+        """
+        Store one sweep point, update the bounds and plot every
+        _redraw_every points
+        """
+        # Append to local data store
+        self.freqs.append(freq)
+        self.reals.append(real_val)
+        self.imags.append(imag_val)
+        self.mags.append(mag)
+
+        if self._note_sample(mag):
+            self._bounds_dirty = True
+
+        # Add the collected points to the plot on the next frame
+        if (not self._plot_pending
+                and len(self.freqs) - self._plotted >= self._redraw_every):
+            self._plot_pending = True
+            self.master.after(self.PLOT_FRAME_MS, self._plot_frame)
+
+    def _plot_frame(self):
+        """
+        Scheduled plot update: draw every point collected since the last one
+        """
+        self._plot_pending = False
+        self.plot_pending()
+
+    def _note_sample(self, mag):
+        """
+        Widen the magnitude bounds to include one sample. Returns True if
+        either changed. The frequency bounds need no tracking: start_sweep
+        fixes them from the sweep parameters.
+        """
+        # Common case first: the sample lies inside the current range
+        if self.mag_min <= mag <= self.mag_max:
+            return False
+        if mag < self.mag_min:
+            self.mag_min = mag
+        if mag > self.mag_max:
+            self.mag_max = mag
+        return True
+
+    def cancel_sweep(self):
+        """
+        Ask the running sweep to stop; points collected so far stay plotted
+        """
+        if self._sweep_queue is not None:
+            self._sweep_cancel.set()
+            self.btn_cancel.config(state=tk.DISABLED)
+
+    def _end_sweep(self):
+        """
+        Forget the finished sweep and restore the sweep controls
+        """
+        self._sweep_queue = None
+        self.btn_sweep.config(state=tk.NORMAL)
+        self.btn_cancel.config(state=tk.DISABLED)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="AD5933 impedance sweep GUI")
+    parser.add_argument("--debug", action="store_true",
+                        help="log every AD5933 register access")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
     root = tk.Tk()
     app = AD5933GUI(root)
     root.mainloop()